@@ -3,67 +3,193 @@ Main entry point for the Gest application.
 Initializes all components and launches the GUI interface.
 """
 
-import sys
-import os
-from pathlib import Path
+from __future__ import annotations
 
-# Add src to path for imports
-current_dir = Path(__file__).parent
-src_dir = current_dir
-sys.path.insert(0, str(src_dir))
+import os
+import sys
+import importlib
+from collections import namedtuple
 
-import tkinter as tk
-from tkinter import ttk, messagebox
-import threading
-import time
-from typing import Optional
+# Let sibling packages resolve when loaded as src.main from the repo root,
+# where the top-level config/ YAML directory would otherwise shadow them
+src_dir = os.path.dirname(os.path.abspath(__file__))
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
 
 # Import Gest modules
 from config.settings import get_config_manager
-from core.camera_manager import get_camera_manager
-from core.detection_engine import get_detection_engine
-from core.feature_processor import get_feature_processor
-from core.gesture_classifier import get_gesture_classifier
-from core.action_executor import get_action_executor
-from gui.gesture_trainer import GestureTrainerGUI
-from utils.logger import setup_logger, get_logger
 from utils.error_handler import handle_exceptions
 
+# Modules that are only imported when first needed. Every function-local
+# import in this file must be listed here (checked by tests/test_main.py).
+DEFERRED_IMPORTS = (
+    "traceback",
+    "tkinter",
+    "tkinter.ttk",
+    "tkinter.messagebox",
+    "utils.logger",
+    "core.camera_manager",
+    "core.detection_engine",
+    "core.feature_processor",
+    "core.gesture_classifier",
+    "core.action_executor",
+    "gui.gesture_trainer",
+)
+
+def eager_import() -> None:
+    """
+    Import every deferred module immediately.
+    
+    Enabled with GEST_EAGER_IMPORT=1 (e.g. in CI) so that a broken deferred
+    import fails at startup instead of when a mode first needs it.
+    """
+    for module_name in DEFERRED_IMPORTS:
+        importlib.import_module(module_name)
+
+if os.environ.get("GEST_EAGER_IMPORT") == "1":
+    eager_import()
+
+class GuiConfig(namedtuple(
+    "GuiConfig",
+    ["window_title", "window_size"],
+    defaults=["Gest - Gesture Recognition", (1200, 800)]
+)):
+    """
+    GUI settings resolved once from the loaded configuration.
+    Immutable and dict-free, so repeated lookups are plain attribute access.
+    
+    Attributes:
+        window_title: Main window title
+        window_size: (width, height) of the main window in pixels
+    """
+    
+    __slots__ = ()
+    
+    @classmethod
+    def from_settings(cls, settings: dict) -> GuiConfig:
+        """
+        Build GUI config from the ``gui`` section of the settings.
+        
+        Args:
+            settings: Settings dictionary from the config manager
+            
+        Returns:
+            GuiConfig with defaults for any missing values
+        """
+        gui = settings.get("gui") or {}
+        return cls(
+            window_title=gui.get("window_title", cls._field_defaults["window_title"]),
+            window_size=tuple(gui.get("window_size", cls._field_defaults["window_size"]))
+        )
+
 class GestApplication:
     """
     Main application class for Gest gesture recognition system.
     """
     
-    def __init__(self):
-        """Initialize the Gest application."""
-        # Setup logging first
-        self.logger = setup_logger()
+    __slots__ = (
+        "config_manager", "settings", "gui_config",
+        "root", "main_gui", "trainer_window", "trainer_gui",
+        "_logger", "_camera_manager", "_detection_engine",
+        "_feature_processor", "_gesture_classifier", "_action_executor",
+        "_initialized",
+    )
+    
+    def __init__(self, root=None):
+        """
+        Initialize the Gest application.
+        
+        Args:
+            root: Optional existing Tk root (e.g. the one used for the
+                startup dialog); a new one is created if omitted
+        """
+        # Lazily created logger and core components
+        self._logger = None
+        self._camera_manager = None
+        self._detection_engine = None
+        self._feature_processor = None
+        self._gesture_classifier = None
+        self._action_executor = None
+        
+        # Names of lazily created core components, in creation order
+        self._initialized: list[str] = []
+        
         self.logger.info("Starting Gest Application...")
         
         # Load configuration
         try:
             self.config_manager = get_config_manager()
             self.settings = self.config_manager.load_settings()
+            self.gui_config = GuiConfig.from_settings(self.settings)
             self.logger.info("Configuration loaded successfully")
         except Exception as e:
-            self.logger.error(f"Failed to load configuration: {e}")
+            self.logger.error("Failed to load configuration: {}", e)
             sys.exit(1)
         
-        # Initialize core components
-        self.camera_manager = get_camera_manager()
-        self.detection_engine = get_detection_engine()
-        self.feature_processor = get_feature_processor()
-        self.gesture_classifier = get_gesture_classifier()
-        self.action_executor = get_action_executor()
-        
         # GUI components
-        self.root = None
+        self.root = root
         self.main_gui = None
         self.trainer_window = None
+        self.trainer_gui = None
         
         self.logger.info("Gest application initialized successfully")
     
-    @handle_exceptions
+    @property
+    def logger(self):
+        """Application logger, configured on first access."""
+        if self._logger is None:
+            from utils.logger import setup_logger
+            self._logger = setup_logger()
+        return self._logger
+    
+    # Core components are created on first access so that the heavy
+    # vision/ML stack is only imported when a mode actually needs it.
+    
+    @property
+    def camera_manager(self):
+        """Camera manager, created on first access."""
+        if self._camera_manager is None:
+            from core.camera_manager import get_camera_manager
+            self._camera_manager = get_camera_manager()
+            self._initialized.append("camera_manager")
+        return self._camera_manager
+    
+    @property
+    def detection_engine(self):
+        """Detection engine, created on first access."""
+        if self._detection_engine is None:
+            from core.detection_engine import get_detection_engine
+            self._detection_engine = get_detection_engine()
+            self._initialized.append("detection_engine")
+        return self._detection_engine
+    
+    @property
+    def feature_processor(self):
+        """Feature processor, created on first access."""
+        if self._feature_processor is None:
+            from core.feature_processor import get_feature_processor
+            self._feature_processor = get_feature_processor()
+            self._initialized.append("feature_processor")
+        return self._feature_processor
+    
+    @property
+    def gesture_classifier(self):
+        """Gesture classifier, created on first access."""
+        if self._gesture_classifier is None:
+            from core.gesture_classifier import get_gesture_classifier
+            self._gesture_classifier = get_gesture_classifier()
+            self._initialized.append("gesture_classifier")
+        return self._gesture_classifier
+    
+    @property
+    def action_executor(self):
+        """Action executor, created on first access."""
+        if self._action_executor is None:
+            from core.action_executor import get_action_executor
+            self._action_executor = get_action_executor()
+            self._initialized.append("action_executor")
+        return self._action_executor
+    
     def initialize_camera(self) -> bool:
         """
         Initialize camera system.
@@ -77,27 +203,30 @@ class GestApplication:
             
             if success:
                 camera_info = self.camera_manager.get_camera_info()
-                self.logger.info(f"Camera initialized: {camera_info}")
+                self.logger.info("Camera initialized: {}", camera_info)
             else:
                 self.logger.error("Failed to initialize camera")
             
             return success
             
         except Exception as e:
-            self.logger.error(f"Camera initialization error: {e}")
+            self.logger.error("Camera initialization error: {}", e)
             return False
     
     def create_main_window(self) -> None:
         """Create and configure the main application window."""
-        self.root = tk.Tk()
+        import tkinter as tk
+        
+        if self.root is None:
+            self.root = tk.Tk()
         
         # Configure window
-        gui_config = self.settings.get("gui", {})
-        window_title = gui_config.get("window_title", "Gest - Gesture Recognition")
-        window_size = gui_config.get("window_size", [1200, 800])
+        gui = self.gui_config
+        window_title = gui.window_title
+        window_width, window_height = gui.window_size
         
         self.root.title(window_title)
-        self.root.geometry(f"{window_size[0]}x{window_size[1]}")
+        self.root.geometry(f"{window_width}x{window_height}")
         self.root.configure(bg='#f0f0f0')
         
         # Configure styles
@@ -106,10 +235,15 @@ class GestApplication:
         # Handle window closing
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
         
-        self.logger.info(f"Main window created: {window_title}")
+        # Root may have been withdrawn while the startup dialog was shown
+        self.root.deiconify()
+        
+        self.logger.info("Main window created: {}", window_title)
     
     def configure_styles(self) -> None:
         """Configure ttk styles for the application."""
+        from tkinter import ttk
+        
         style = ttk.Style()
         
         # Configure accent button style
@@ -120,18 +254,27 @@ class GestApplication:
             font=('Arial', 10, 'bold')
         )
     
-    def show_startup_dialog(self) -> str:
+    @staticmethod
+    def show_startup_dialog(root) -> str:
         """
         Show startup dialog to choose application mode.
         
+        Only needs a Tk root, so it can run before the application (and its
+        logger and configuration) is created.
+        
+        Args:
+            root: Tk root the dialog is attached to
+            
         Returns:
             Selected mode: 'main', 'trainer', or 'exit'
         """
-        dialog = tk.Toplevel()
+        import tkinter as tk
+        from tkinter import ttk
+        
+        dialog = tk.Toplevel(root)
         dialog.title("Gest - Choose Mode")
         dialog.geometry("400x300")
         dialog.configure(bg='#f0f0f0')
-        dialog.transient(self.root)
         dialog.grab_set()
         
         result = tk.StringVar(value="exit")
@@ -168,6 +311,8 @@ class GestApplication:
     def run_trainer_mode(self) -> None:
         """Run the gesture trainer application."""
         try:
+            from gui.gesture_trainer import GestureTrainerGUI
+            
             self.trainer_gui = GestureTrainerGUI(self.root)
             
             # Hide main window content and show trainer
@@ -177,24 +322,25 @@ class GestApplication:
             self.logger.info("Gesture trainer mode started")
             
         except Exception as e:
-            self.logger.error(f"Error running trainer mode: {e}")
+            from tkinter import messagebox
+            
+            self.logger.error("Error running trainer mode: {}", e)
             messagebox.showerror("Error", f"Failed to start trainer mode: {e}")
     
     @handle_exceptions
-    def run(self) -> None:
-        """Run the Gest application."""
+    def run(self, mode: str) -> None:
+        """
+        Run the Gest application.
+        
+        Args:
+            mode: Mode chosen in the startup dialog ('main' or 'trainer')
+        """
         self.logger.info("Starting Gest application...")
         
         # Create main window
         self.create_main_window()
         
-        # Show startup dialog
-        mode = self.show_startup_dialog()
-        
-        if mode == "exit":
-            self.on_closing()
-            return
-        elif mode == "trainer":
+        if mode == "trainer":
             self.run_trainer_mode()
         
         # Start main event loop
@@ -205,13 +351,12 @@ class GestApplication:
         """Handle application closing."""
         self.logger.info("Closing Gest application...")
         
-        # Stop any ongoing operations
-        if hasattr(self, 'camera_manager'):
-            self.camera_manager.release()
-        
-        # Release other resources
-        if hasattr(self, 'detection_engine'):
-            self.detection_engine.release()
+        # Release only the components that were actually created; touching
+        # the lazy properties here would construct them just to release them
+        for name in self._initialized:
+            release = getattr(getattr(self, name), "release", None)
+            if release is not None:
+                release()
         
         # Close GUI
         if self.root:
@@ -223,8 +368,19 @@ class GestApplication:
 def main():
     """Main function."""
     try:
-        app = GestApplication()
-        app.run()
+        import tkinter as tk
+        
+        # Let the user choose a mode before any application setup happens
+        root = tk.Tk()
+        root.withdraw()
+        mode = GestApplication.show_startup_dialog(root)
+        
+        if mode == "exit":
+            root.destroy()
+            return
+        
+        app = GestApplication(root)
+        app.run(mode)
     except KeyboardInterrupt:
         print("\nApplication interrupted by user")
     except Exception as e:
@@ -0,0 +1,225 @@
+"""
+Tests for deferred imports in the Gest entry point.
+"""
+
+import ast
+import importlib
+import importlib.machinery
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+MAIN_PATH = Path(__file__).resolve().parent.parent / "src" / "main.py"
+
+def _find_spec(name):
+    """
+    Locate a module without executing it or any of its parent packages.
+    
+    importlib.util.find_spec imports parent packages for dotted names; this
+    walks sys.path one segment at a time instead, so probing has no side
+    effects on sys.modules.
+    
+    Args:
+        name: Absolute module name
+        
+    Returns:
+        The module spec, or None if it cannot be found
+    """
+    parts = name.split(".")
+    path, spec = None, None
+    for index in range(len(parts)):
+        if spec is not None:
+            path = spec.submodule_search_locations
+            if path is None:
+                return None
+        spec = importlib.machinery.PathFinder.find_spec(".".join(parts[:index + 1]), path)
+        if spec is None:
+            return None
+    return spec
+
+def _is_importable(name):
+    """Return True if *name* can be found as a module."""
+    return name in sys.modules or _find_spec(name) is not None
+
+def _function_local_imports():
+    """
+    Collect imports made inside function bodies of main.py.
+    
+    Returns:
+        Tuple of (imported module names, submodules pulled in by
+        ``from package import submodule``)
+    """
+    tree = ast.parse(MAIN_PATH.read_text(encoding="utf-8"))
+    modules, submodules = set(), set()
+    for function in ast.walk(tree):
+        if not isinstance(function, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            continue
+        for node in ast.walk(function):
+            if isinstance(node, ast.Import):
+                modules.update(alias.name for alias in node.names)
+            elif isinstance(node, ast.ImportFrom):
+                modules.add(node.module)
+                # Only a package can provide ``from package import submodule``
+                package = _find_spec(node.module)
+                if package is None or package.submodule_search_locations is None:
+                    continue
+                for alias in node.names:
+                    candidate = f"{node.module}.{alias.name}"
+                    if _find_spec(candidate) is not None:
+                        submodules.add(candidate)
+    return modules, submodules
+
+@pytest.fixture
+def import_main(monkeypatch):
+    """Import a fresh copy of main with its eager dependencies stubbed."""
+    settings = types.ModuleType("config.settings")
+    settings.get_config_manager = lambda: types.SimpleNamespace(
+        load_settings=lambda: {}
+    )
+    error_handler = types.ModuleType("utils.error_handler")
+    error_handler.handle_exceptions = lambda func: func
+    
+    monkeypatch.setitem(sys.modules, "config", types.ModuleType("config"))
+    monkeypatch.setitem(sys.modules, "config.settings", settings)
+    monkeypatch.setitem(sys.modules, "utils.error_handler", error_handler)
+    monkeypatch.delenv("GEST_EAGER_IMPORT", raising=False)
+    
+    def _import():
+        monkeypatch.delitem(sys.modules, "main", raising=False)
+        return importlib.import_module("main")
+    
+    return _import
+
+def test_deferred_imports_match_function_local_imports(import_main):
+    main = import_main()
+    modules, submodules = _function_local_imports()
+    
+    missing = (modules | submodules) - set(main.DEFERRED_IMPORTS)
+    stale = set(main.DEFERRED_IMPORTS) - modules - submodules
+    
+    assert not missing, f"Deferred imports not listed in DEFERRED_IMPORTS: {sorted(missing)}"
+    assert not stale, f"DEFERRED_IMPORTS entries not imported anywhere: {sorted(stale)}"
+
+def test_deferred_modules_not_imported_by_default(import_main, monkeypatch):
+    monkeypatch.setitem(sys.modules, "gui.gesture_trainer", None)
+    
+    main = import_main()
+    
+    assert main.GestApplication is not None
+
+def test_eager_import_surfaces_import_error(import_main, monkeypatch):
+    main = import_main()
+    broken = "gui.gesture_trainer"
+    
+    # Stub whatever is unavailable here so only the broken module can fail
+    for name in main.DEFERRED_IMPORTS:
+        if name != broken and not _is_importable(name):
+            monkeypatch.setitem(sys.modules, name, types.ModuleType(name))
+    monkeypatch.setitem(sys.modules, broken, None)
+    monkeypatch.setenv("GEST_EAGER_IMPORT", "1")
+    
+    with pytest.raises(ImportError):
+        import_main()
+
+COMPONENTS = (
+    "camera_manager",
+    "detection_engine",
+    "feature_processor",
+    "gesture_classifier",
+    "action_executor",
+)
+
+class _StubLogger:
+    """Logger stand-in that discards every record."""
+    
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+class _StubComponent:
+    """Core component stand-in that records release() calls."""
+    
+    def __init__(self):
+        self.released = 0
+    
+    def release(self):
+        self.released += 1
+
+def _recording_factory(instances):
+    """Build a component factory that appends each instance to *instances*."""
+    def factory():
+        component = _StubComponent()
+        instances.append(component)
+        return component
+    return factory
+
+@pytest.fixture
+def components(monkeypatch):
+    """
+    Stub the logger and the core component factories.
+    
+    Returns:
+        Dict mapping component name to the list of instances its factory built
+    """
+    logger_module = types.ModuleType("utils.logger")
+    logger_module.setup_logger = _StubLogger
+    monkeypatch.setitem(sys.modules, "utils.logger", logger_module)
+    monkeypatch.setitem(sys.modules, "core", types.ModuleType("core"))
+    
+    created = {}
+    for name in COMPONENTS:
+        instances = created[name] = []
+        module = types.ModuleType(f"core.{name}")
+        setattr(module, f"get_{name}", _recording_factory(instances))
+        monkeypatch.setitem(sys.modules, f"core.{name}", module)
+    return created
+
+def test_components_created_on_first_access(import_main, components):
+    app = import_main().GestApplication()
+    
+    assert app._initialized == []
+    assert not any(components.values())
+    
+    first = app.camera_manager
+    
+    assert app.camera_manager is first
+    assert components["camera_manager"] == [first]
+    assert app._initialized == ["camera_manager"]
+
+def test_on_closing_creates_no_components(import_main, components):
+    app = import_main().GestApplication()
+    
+    app.on_closing()
+    
+    assert not any(components.values())
+    assert app._initialized == []
+
+def test_on_closing_releases_only_created_components(import_main, components):
+    app = import_main().GestApplication()
+    camera = app.camera_manager
+    classifier = app.gesture_classifier
+    
+    app.on_closing()
+    
+    assert camera.released == 1
+    assert classifier.released == 1
+    assert app._initialized == ["camera_manager", "gesture_classifier"]
+    assert not components["detection_engine"]
+    assert not components["feature_processor"]
+    assert not components["action_executor"]
+
+def test_gui_config_defaults(import_main):
+    GuiConfig = import_main().GuiConfig
+    
+    assert GuiConfig.from_settings({}) == GuiConfig()
+    assert GuiConfig.from_settings({"gui": None}) == GuiConfig()
+    assert GuiConfig() == ("Gest - Gesture Recognition", (1200, 800))
+
+def test_gui_config_from_settings(import_main):
+    GuiConfig = import_main().GuiConfig
+    
+    gui = GuiConfig.from_settings({"gui": {"window_title": "Test", "window_size": [640, 480]}})
+    
+    assert gui.window_title == "Test"
+    assert gui.window_size == (640, 480)
@@ -0,0 +1,35 @@
+"""
+Tests for the lazy logging namespace of the utils package.
+"""
+
+import importlib
+import sys
+
+import pytest
+
+@pytest.fixture
+def import_utils(monkeypatch):
+    """Import a fresh copy of utils with Loguru unavailable."""
+    monkeypatch.setitem(sys.modules, "loguru", None)
+    
+    def _import():
+        monkeypatch.delitem(sys.modules, "utils", raising=False)
+        monkeypatch.delitem(sys.modules, "utils._logger_impl", raising=False)
+        return importlib.import_module("utils")
+    
+    return _import
+
+def test_import_does_not_load_loguru(import_utils, monkeypatch):
+    monkeypatch.delenv("GEST_EAGER_IMPORT", raising=False)
+    
+    utils = import_utils()
+    
+    assert "utils._logger_impl" not in sys.modules
+    with pytest.raises(ImportError):
+        utils.get_logger
+
+def test_eager_import_surfaces_import_error(import_utils, monkeypatch):
+    monkeypatch.setenv("GEST_EAGER_IMPORT", "1")
+    
+    with pytest.raises(ImportError):
+        import_utils()